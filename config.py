@@ -4,10 +4,20 @@ from dotenv import load_dotenv
 load_dotenv()
 
 BOT_TOKEN = os.getenv("BOT_TOKEN")
-ADMIN_ID = int(os.getenv("ADMIN_ID", 0))
+_ADMIN_ID_RAW = os.getenv("ADMIN_ID", "").strip()
+# Некорректное значение не роняет импорт — его отклоняет validate()
+ADMIN_ID = int(_ADMIN_ID_RAW) if _ADMIN_ID_RAW.lstrip('-').isdigit() else None
+
+
+def validate():
+    """Проверяет обязательные параметры. Вызывается при запуске бота, а не при импорте."""
+    if not BOT_TOKEN:
+        raise ValueError("ОШИБКА: BOT_TOKEN не найден в .env!")
+    if not _ADMIN_ID_RAW:
+        raise ValueError("ОШИБКА: ADMIN_ID не найден в .env!")
+    if ADMIN_ID is None:
+        raise ValueError(f"ОШИБКА: ADMIN_ID должен быть целым числом, получено: {_ADMIN_ID_RAW!r}")
 
-if not BOT_TOKEN:
-    raise ValueError("ОШИБКА: BOT_TOKEN не найден в .env!")
 
 # Параметры стратегии
 TICKERS = [
@@ -8,7 +8,6 @@ from aiogram.filters import Command
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 import config
 from database import init_db, add_subscriber, remove_subscriber, get_all_subscribers
@@ -20,9 +19,8 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-bot = Bot(token=config.BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN))
+# Bot и планировщик создаются в main(): импорт модуля не требует BOT_TOKEN
 dp = Dispatcher()
-scheduler = AsyncIOScheduler(timezone="UTC")
 
 # Глобальная сессия (инициализируется в main)
 http_session: aiohttp.ClientSession = None
@@ -153,9 +151,16 @@ async def cb_status(callback: CallbackQuery):
 async def main():
     global http_session
 
+    config.validate()
+
     if os.name == 'nt':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+    bot = Bot(token=config.BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN))
+    scheduler = AsyncIOScheduler(timezone="UTC")
+
     async with aiohttp.ClientSession() as session:
         http_session = session
 
@@ -2,16 +2,24 @@ import asyncio
 import logging
 import aiohttp
 from aiogram import Bot
-from typing import Optional
 
 import config
 from database import get_all_subscribers
-from data_gateway import fetch_ohlcv_with_retry
-from math_engine import calculate_indicators, evaluate_signal
+
+
+def _load_engine():
+    """Возвращает (fetch_ohlcv_with_retry, calculate_indicators, evaluate_signal)."""
+    # data_gateway и math_engine тянут pandas/numpy — импортируем их лениво,
+    # при первом сканировании, чтобы не замедлять старт бота.
+    from data_gateway import fetch_ohlcv_with_retry
+    from math_engine import calculate_indicators, evaluate_signal
+    return fetch_ohlcv_with_retry, calculate_indicators, evaluate_signal
 
 
 async def analyze_single_coin(session: aiohttp.ClientSession, symbol: str) -> str:
     """Анализирует одну монету и возвращает подробный отчёт."""
+    fetch_ohlcv_with_retry, calculate_indicators, evaluate_signal = _load_engine()
+
     df = await fetch_ohlcv_with_retry(session, symbol, config.TIMEFRAME)
     if df is None:
         return f"❌ Не удалось получить данные для {symbol}"
@@ -56,6 +64,8 @@ async def analyze_single_coin(session: aiohttp.ClientSession, symbol: str) -> st
 
 async def scan_market_now(session: aiohttp.ClientSession) -> str:
     """Мгновенное сканирование всех монет. Возвращает текст результата."""
+    fetch_ohlcv_with_retry, calculate_indicators, evaluate_signal = _load_engine()
+
     signals = []
     no_signal_coins = []
 
@@ -81,6 +91,8 @@ async def scan_market_now(session: aiohttp.ClientSession) -> str:
 
 async def scan_market_and_notify(bot: Bot, session: aiohttp.ClientSession):
     """Задача для планировщика: анализ и отправка всем подписчикам."""
+    fetch_ohlcv_with_retry, calculate_indicators, evaluate_signal = _load_engine()
+
     logging.info("Инициализирован цикл сканирования...")
     signals = []
 
@@ -0,0 +1,59 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Бюджеты импорта (мкс, по выводу `python -X importtime`).
+# Время aiogram (сборка pydantic-моделей) сюда не входит — оно от нас не зависит.
+# Регрессию ленивой загрузки ловит orchestrator: с pandas ~410 мс, без — ~2 мс.
+ORCHESTRATOR_BUDGET_US = 50_000
+# Собственные модули: self-время main + кумулятивное config, database, orchestrator.
+OWN_MODULES_BUDGET_US = 100_000
+
+LAZY_MODULES = ('pandas', 'numpy', 'data_gateway', 'math_engine', 'apscheduler')
+
+
+def _import_main():
+    env = {k: v for k, v in os.environ.items() if k != 'BOT_TOKEN'}
+    code = (
+        "import sys, main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+
+
+def _import_time_us(importtime_log: str, module: str) -> tuple[int, int]:
+    """Возвращает (self, cumulative) для модуля верхнего уровня."""
+    match = re.search(
+        rf'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|\s*{re.escape(module)}$',
+        importtime_log, re.MULTILINE,
+    )
+    assert match, f"{module} не найден в выводе -X importtime"
+    return int(match.group(1)), int(match.group(2))
+
+
+def test_import_main_without_token_skips_heavy_modules():
+    result = _import_main()
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ''
+
+
+def test_import_main_within_budget():
+    result = _import_main()
+    assert result.returncode == 0, result.stderr
+
+    _, orchestrator_us = _import_time_us(result.stderr, 'orchestrator')
+    assert orchestrator_us < ORCHESTRATOR_BUDGET_US
+
+    main_self_us, _ = _import_time_us(result.stderr, 'main')
+    own_us = main_self_us + sum(
+        _import_time_us(result.stderr, module)[1]
+        for module in ('config', 'database', 'orchestrator')
+    )
+    assert own_us < OWN_MODULES_BUDGET_US